@@ -9,13 +9,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from typing import Optional
 
-from .extractor import extract_numbers_from_pdf, find_largest_number, NumberHit
+from .extractor import BACKENDS, extract_numbers_from_pdf, find_largest_number, NumberHit
 
 __version__ = "0.1.0"
 __all__ = ["extract_numbers_from_pdf", "find_largest_number", "NumberHit", "main"]
 
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
 
 def main(pdf_path: Optional[str] = None) -> None:
     """
@@ -58,6 +61,14 @@ def main(pdf_path: Optional[str] = None) -> None:
             "--max-scaled", type=float, default=None,
             help="Maximum scaled value to include in results"
         )
+        parser.add_argument(
+            "--workers", type=int, default=DEFAULT_WORKERS,
+            help=f"Number of processes used to scan pages (default: {DEFAULT_WORKERS})"
+        )
+        parser.add_argument(
+            "--backend", choices=BACKENDS, default="pdfplumber",
+            help="PDF text extraction backend (default: pdfplumber; pymupdf is faster)"
+        )
         
         args = parser.parse_args()
         pdf_path_arg = args.pdf
@@ -71,25 +82,27 @@ def main(pdf_path: Optional[str] = None) -> None:
             no_scaling = False
             min_scaled = None
             max_scaled = None
+            workers = DEFAULT_WORKERS
+            backend = "pdfplumber"
         args = Args()
         pdf_path_arg = pdf_path
 
-    # Extract numbers with scaling
-    hits = extract_numbers_from_pdf(
+    # Extract the top N numbers with scaling
+    top_hits = extract_numbers_from_pdf(
         pdf_path_arg,
         start_page=args.start_page,
         end_page=args.end_page,
         min_scaled=args.min_scaled,
         max_scaled=args.max_scaled,
+        workers=args.workers,
+        top_n=args.top if args.top > 0 else None,
+        backend=args.backend,
     )
     
-    if not hits:
+    if not top_hits:
         print("No numbers found in the PDF", file=__import__("sys").stderr)
         return
     
-    # Get top N results
-    top_hits = hits[:args.top] if args.top > 0 else hits
-    
     if args.json:
         # JSON output
         results = []
@@ -7,23 +7,38 @@ based on context cues like "Dollars in Millions".
 
 from __future__ import annotations
 
+import heapq
+import math
+import os
 import re
-from typing import List, Dict, Tuple, Optional, Any, Iterator
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Tuple, Optional, Any, Iterator
 from dataclasses import dataclass
+from operator import itemgetter
 
+import numpy as np
 import pdfplumber
 
-from .scale import detect_scale_phrase, detect_scale_phrase_in_region, scale_factor
+from .scale import detect_scale_phrase_in_lines, scale_factor
 
 
-# Number parsing regex - handles $, commas, decimals, parentheses, %, footnotes
+# Number parsing regex - handles $, commas, decimals, parentheses, %, footnotes.
+# The integer part is an atomic group and the fraction possessive: nothing
+# after them can consume digits, so giving characters back can never produce
+# a match and the engine is stopped from trying.
 _GROUP_SEP = ",\u00A0\u2009"  # comma, NBSP, thin space
 NUM_RE = re.compile(
     r"^\s*(?P<prefix>[\$\(]?)\s*"
-    r"(?P<num>(?:\d{1,3}(?:[" + _GROUP_SEP + r"]\d{3})+|\d+)(?:\.\d+)?|(?:\.\d+))"
+    r"(?P<num>(?>\d{1,3}(?:[" + _GROUP_SEP + r"]\d{3})+|\d+)(?:\.\d+)?+|(?:\.\d+))"
     r"\s*(?P<suffix>[%\)]?)"
     r"(?P<foot>[\*\u2020\u2021\u00B9\u00B2\u00B3\u2070-\u2079]*)\s*$"
 )
+# Characters a stripped token can start with and still match NUM_RE
+# (besides other Unicode decimal digits, which \d also accepts)
+_NUM_START = frozenset("$(.0123456789")
 
 # Unit classification patterns
 HEADCOUNT_PAT = re.compile(
@@ -37,7 +52,7 @@ MONEY_HINT_PAT = re.compile(
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NumberHit:
     """Represents a number found in the PDF with scaling and context information."""
     page_num: int
@@ -59,49 +74,38 @@ class NumberHit:
 def parse_number(token: str) -> Optional[float]:
     """Parse a token into a numeric value, handling various formats."""
     token = (token or "").strip()
+    # Cheap reject for prose before entering the regex engine
+    if not token or (token[0] not in _NUM_START and not token[0].isdecimal()):
+        return None
     m = NUM_RE.match(token)
     if not m:
         return None
     
-    num = (
-        m.group("num")
-        .replace(",", "")
-        .replace("\u00A0", "")  # NBSP
-        .replace("\u2009", "")  # thin space
-    )
+    prefix, num, suffix = m.group("prefix", "num", "suffix")
+    if suffix == "%":
+        return None  # Skip percentages in ranking
+    
+    # Plain ASCII digits (the common case) go straight to float(); only
+    # tokens that can contain a group separator pay for stripping them, and
+    # only non-ASCII ones are scanned for NBSP/thin space
+    if "," in num:
+        num = num.replace(",", "")
+    if not num.isascii():
+        num = num.replace("\u00A0", "").replace("\u2009", "")  # NBSP, thin space
     
     try:
         val = float(num)
     except ValueError:
         return None
     
-    # Handle parentheses (negative) and percentages
-    if m.group("prefix") == "(" and m.group("suffix") == ")":
+    # Handle parentheses (negative)
+    if prefix == "(" and suffix == ")":
         val = -val
-    if m.group("suffix") == "%":
-        return None  # Skip percentages in ranking
     
     return val
 
 
-def classify_units_for_word(word: dict, line_words: List[dict]) -> str:
-    """
-    Classify the units of a number based on surrounding context.
-    
-    Returns:
-        'people': Headcount, FTE, personnel numbers
-        'money': Dollar amounts, financial figures  
-        'unknown': Ambiguous cases (will use table/page scaling)
-    """
-    x_left = float(word.get("x0", 0.0))
-    
-    # Look at words to the left of this number on the same visual line
-    left_text = " ".join(
-        str(w.get("text", "")) 
-        for w in line_words 
-        if float(w.get("x1", 0.0)) <= x_left - 2.0
-    )
-    
+def _units_for_left_text(left_text: str) -> str:
     if not left_text:
         return "unknown"
     
@@ -113,6 +117,49 @@ def classify_units_for_word(word: dict, line_words: List[dict]) -> str:
     return "unknown"
 
 
+def _left_contexts(
+    line_idx: List[int],
+    x1s: List[float],
+    texts: List[str],
+) -> Optional[Tuple[List[float], List[str]]]:
+    """Running left-context strings for one line of words.
+    
+    Returns (line_x1s, prefixes) where prefixes[k] is the text of the line's
+    first k words, so the context of a number at x0 is
+    prefixes[bisect_right(line_x1s, x0 - 2.0)]. Returns None when the words
+    aren't in x1 order (e.g. two text rows sharing a Y bucket); callers then
+    fall back to ``_classify_units_at``.
+    """
+    line_x1s = [x1s[j] for j in line_idx]
+    if any(a > b for a, b in zip(line_x1s, line_x1s[1:])):
+        return None
+    prefixes = [""]
+    for k, j in enumerate(line_idx):
+        prefixes.append(texts[j] if k == 0 else prefixes[-1] + " " + texts[j])
+    return line_x1s, prefixes
+
+
+def _classify_units_at(
+    i: int,
+    line_idx: np.ndarray,
+    x0s: np.ndarray,
+    x1s: np.ndarray,
+    texts: List[str],
+) -> str:
+    """
+    Classify the units of word ``i`` from the words to its left on its line.
+    
+    ``line_idx`` holds the indices of the words sharing word ``i``'s line.
+    
+    Returns:
+        'people': Headcount, FTE, personnel numbers
+        'money': Dollar amounts, financial figures  
+        'unknown': Ambiguous cases (will use table/page scaling)
+    """
+    left = line_idx[np.flatnonzero(x1s[line_idx] <= x0s[i] - 2.0)]
+    return _units_for_left_text(" ".join(texts[j] for j in left.tolist()))
+
+
 def inside_bbox(box: Tuple[float, float, float, float], 
                 region: Tuple[float, float, float, float], 
                 tolerance: float = 0.5) -> bool:
@@ -123,13 +170,380 @@ def inside_bbox(box: Tuple[float, float, float, float],
             y0 >= ry0 - tolerance and y1 <= ry1 + tolerance)
 
 
-def group_words_by_line(words: List[dict], bucket_size: float = 10.0) -> Dict[float, List[dict]]:
-    """Group words into approximate lines by Y coordinate."""
-    lines = {}
-    for w in words:
-        y_key = round(float(w.get("top", 0.0)) / bucket_size) * bucket_size
-        lines.setdefault(y_key, []).append(w)
-    return lines
+def _inside_regions(
+    boxes: np.ndarray,
+    regions: np.ndarray,
+    tolerance: float = 0.5,
+) -> np.ndarray:
+    """(N, T) mask of which regions contain each box, with ``inside_bbox`` semantics.
+    
+    ``boxes`` is (N, 4) and ``regions`` is (T, 4), both as x0, top, x1, bottom.
+    """
+    b = boxes[:, None, :]
+    r = regions[None, :, :]
+    return (
+        (b[..., 0] >= r[..., 0] - tolerance) & (b[..., 2] <= r[..., 2] + tolerance)
+        & (b[..., 1] >= r[..., 1] - tolerance) & (b[..., 3] <= r[..., 3] + tolerance)
+    )
+
+
+def _first_region(inside: np.ndarray) -> np.ndarray:
+    """Index of the first True column in each row of an ``_inside_regions`` mask, or -1."""
+    if not inside.shape[1]:
+        return np.full(len(inside), -1, dtype=np.intp)
+    return np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
+
+
+def _line_keys(tops: np.ndarray, bucket_size: float = 10.0) -> np.ndarray:
+    """Y bucket (approximate line) key for each word, in word order."""
+    return np.rint(tops / bucket_size) * bucket_size
+
+
+def _line_indices(keys: np.ndarray) -> Dict[float, np.ndarray]:
+    """Map each line key to the indices of its words, in ascending Y order."""
+    order = np.argsort(keys, kind="stable")
+    line_keys, starts = np.unique(keys[order], return_index=True)
+    return dict(zip(line_keys.tolist(), np.split(order, starts[1:])))
+
+
+def group_words_by_line(
+    words: List[dict],
+    bucket_size: float = 10.0,
+) -> Dict[float, List[dict]]:
+    """Group words into approximate lines by Y coordinate.
+    
+    Lines are keyed in ascending Y order and keep the original word order
+    within each line.
+    """
+    tops = np.fromiter(
+        (float(w.get("top", 0.0)) for w in words), dtype=np.float64, count=len(words)
+    )
+    return {
+        y_key: [words[i] for i in idx.tolist()]
+        for y_key, idx in _line_indices(_line_keys(tops, bucket_size)).items()
+    }
+
+
+BACKENDS = ("pdfplumber", "pymupdf")
+
+# Every backend produces word dicts with at least these keys
+_WORD_FIELDS = itemgetter("x0", "top", "x1", "bottom", "text")
+
+_PAGE_CACHE_SIZE = 512
+_PageKey = Tuple[str, float, str, int, float, float]
+_page_cache: "OrderedDict[_PageKey, Tuple[NumberHit, ...]]" = OrderedDict()
+# get + move_to_end and put + evict are not atomic; callers may share the
+# cache across threads
+_page_cache_lock = threading.Lock()
+
+
+def _import_pymupdf() -> Any:
+    try:
+        import pymupdf
+    except ImportError as e:
+        raise ImportError(
+            "The 'pymupdf' backend requires PyMuPDF: pip install 'conductor-takehome[pymupdf]'"
+        ) from e
+    # Newer releases print a layout-package hint to stdout from find_tables,
+    # which would corrupt --json output
+    if hasattr(pymupdf, "no_recommend_layout"):
+        pymupdf.no_recommend_layout()
+    return pymupdf
+
+
+def _open_pdf(pdf_path: str, backend: str) -> Any:
+    """Open a document with the given backend; usable as a context manager."""
+    if backend == "pymupdf":
+        return _import_pymupdf().open(pdf_path)
+    if backend == "pdfplumber":
+        return pdfplumber.open(pdf_path)
+    raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+
+
+def _page_count(pdf: Any, backend: str) -> int:
+    return len(pdf) if backend == "pymupdf" else len(pdf.pages)
+
+
+def _scan_page(
+    pdf: Any,
+    backend: str,
+    page_num: int,
+    x_tolerance: float,
+    y_tolerance: float,
+) -> Tuple[NumberHit, ...]:
+    """Extract every number on one page of an open document.
+    
+    PyMuPDF splits words itself, so the tolerances only apply to pdfplumber.
+    """
+    if backend == "pymupdf":
+        page = pdf[page_num - 1]
+        words = [
+            {"x0": w[0], "top": w[1], "x1": w[2], "bottom": w[3], "text": w[4]}
+            for w in page.get_text("words")
+        ]
+        return _scan_words(words, page_num, lambda: page.find_tables().tables)
+
+    page = pdf.pages[page_num - 1]
+    words = page.extract_words(x_tolerance=x_tolerance, y_tolerance=y_tolerance) or []
+    return _scan_words(words, page_num, page.find_tables)
+
+
+def _scan_words(
+    words: List[dict],
+    page_num: int,
+    find_tables: Callable[[], List[Any]],
+) -> Tuple[NumberHit, ...]:
+    """Extract every number from a page's words, before threshold filtering.
+    
+    ``find_tables`` returns the page's tables (anything with a ``bbox``); it is
+    only called when the page has numbers.
+    """
+    hits = []
+
+    # One sweep over the word dicts: pull out text and bbox columns and parse
+    # every token, remembering which words are numbers.
+    texts: List[str] = []
+    x0l: List[float] = []
+    topl: List[float] = []
+    x1l: List[float] = []
+    bottoml: List[float] = []
+    numbers: List[Tuple[int, float]] = []
+    # Runs once per word on every page: bind globals to locals and read all
+    # five fields with a single itemgetter call
+    word_fields = _WORD_FIELDS
+    to_float = float
+    parse = parse_number
+    for i, w in enumerate(words):
+        x0, top, x1, bottom, token = word_fields(w)
+        texts.append(token)
+        x0l.append(to_float(x0))
+        topl.append(to_float(top))
+        x1l.append(to_float(x1))
+        bottoml.append(to_float(bottom))
+        raw_val = parse(token)
+        if raw_val is not None:
+            numbers.append((i, raw_val))
+
+    # Cover, TOC and prose pages have nothing to rank; skip the expensive
+    # table finding and scale detection for them
+    if not numbers:
+        return ()
+
+    x0s = np.array(x0l, dtype=np.float64)
+    tops = np.array(topl, dtype=np.float64)
+    x1s = np.array(x1l, dtype=np.float64)
+    bottoms = np.array(bottoml, dtype=np.float64)
+    y_keys = _line_keys(tops)
+    line_idx_map = _line_indices(y_keys)
+    y_keys = y_keys.tolist()
+
+    # Extract tables and their scale information
+    try:
+        tables = find_tables() or []
+    except Exception:
+        tables = []
+
+    table_regions = [tuple(t.bbox) for t in tables if getattr(t, "bbox", None)]
+    word_in_table = _inside_regions(
+        np.column_stack((x0s, tops, x1s, bottoms)),
+        np.array(table_regions, dtype=np.float64).reshape(-1, 4),
+    )
+
+    # Each table's scale phrase is searched in the page's lines restricted to
+    # the words inside it, so the lines aren't re-bucketed per table
+    table_scales = []
+    for t, table_bbox in enumerate(table_regions):
+        in_table = word_in_table[:, t]
+        table_lines = [
+            [words[j] for j in idx[in_table[idx]].tolist()] for idx in line_idx_map.values()
+        ]
+        scale_name, scale_phrase, scale_bbox = detect_scale_phrase_in_lines(
+            [lw for lw in table_lines if lw]
+        )
+        table_scales.append(
+            (table_bbox, scale_name, scale_phrase, scale_bbox, scale_factor(scale_name))
+        )
+
+    # Page-level fallback scale, reusing the line grouping above
+    page_scale_name, page_scale_phrase, page_scale_bbox = detect_scale_phrase_in_lines(
+        [[words[j] for j in idx.tolist()] for idx in line_idx_map.values()]
+    )
+    page_factor = scale_factor(page_scale_name)
+
+    # Each number belongs to the first table containing it
+    number_bboxes = [(x0l[i], topl[i], x1l[i], bottoml[i]) for i, _ in numbers]
+    table_of = _first_region(word_in_table[[i for i, _ in numbers]]).tolist()
+
+    # Process each number, building per-line left contexts on first use
+    contexts: Dict[float, Optional[Tuple[List[float], List[str]]]] = {}
+    for n, (i, raw_val) in enumerate(numbers):
+        token = texts[i]
+        bbox = number_bboxes[n]
+
+        # Find the line this word belongs to
+        y_key = y_keys[i]
+        if y_key not in contexts:
+            contexts[y_key] = _left_contexts(line_idx_map[y_key].tolist(), x1l, texts)
+        context = contexts[y_key]
+
+        # Determine which scale to apply (table-specific or page-level)
+        scale_name = page_scale_name
+        scale_phrase = page_scale_phrase
+        scale_bbox = page_scale_bbox
+        factor = page_factor
+        table_bbox = None
+
+        if table_of[n] >= 0:
+            table_bbox, scale_name, scale_phrase, scale_bbox, factor = table_scales[table_of[n]]
+
+        # Classify the units and apply appropriate scaling
+        if context is not None:
+            line_x1s, prefixes = context
+            units = _units_for_left_text(prefixes[bisect_right(line_x1s, x0l[i] - 2.0)])
+        else:
+            units = _classify_units_at(i, line_idx_map[y_key], x0s, x1s, texts)
+        apply_factor = factor if units != "people" else 1.0
+        scaled_val = raw_val * apply_factor
+
+        hit = NumberHit(
+            page_num=page_num,
+            raw_text=token,
+            raw_value=raw_val,
+            scaled_value=scaled_val,
+            bbox=bbox,
+            units=units,
+            scale_name=scale_name,
+            scale_phrase=scale_phrase,
+            scale_bbox=scale_bbox,
+            table_bbox=table_bbox,
+        )
+        hits.append(hit)
+
+    return tuple(hits)
+
+
+def _cache_get(key: _PageKey) -> Optional[Tuple[NumberHit, ...]]:
+    with _page_cache_lock:
+        page_hits = _page_cache.get(key)
+        if page_hits is not None:
+            _page_cache.move_to_end(key)
+        return page_hits
+
+
+def _cache_put(key: _PageKey, page_hits: Tuple[NumberHit, ...]) -> None:
+    with _page_cache_lock:
+        _page_cache[key] = page_hits
+        if len(_page_cache) > _PAGE_CACHE_SIZE:
+            _page_cache.popitem(last=False)
+
+
+def _scan_page_range(
+    pdf_path: str,
+    backend: str,
+    page_nums: List[int],
+    x_tolerance: float,
+    y_tolerance: float,
+) -> List[Tuple[int, Tuple[NumberHit, ...]]]:
+    """Process-pool worker: scan pages using a private document handle.
+
+    Open documents aren't picklable, so each worker opens the file itself.
+    """
+    with _open_pdf(pdf_path, backend) as pdf:
+        return [
+            (page_num, _scan_page(pdf, backend, page_num, x_tolerance, y_tolerance))
+            for page_num in page_nums
+        ]
+
+
+def _scan_pages_parallel(
+    pdf_path: str,
+    backend: str,
+    page_nums: List[int],
+    workers: int,
+    x_tolerance: float,
+    y_tolerance: float,
+) -> Dict[int, Tuple[NumberHit, ...]]:
+    """Scan pages across a process pool, one interleaved chunk per worker."""
+    workers = min(workers, len(page_nums))
+    # Interleave so dense and sparse sections of the document are spread evenly
+    chunks = [page_nums[i::workers] for i in range(workers)]
+    scanned: Dict[int, Tuple[NumberHit, ...]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_scan_page_range, pdf_path, backend, chunk, x_tolerance, y_tolerance)
+            for chunk in chunks
+        ]
+        for future in futures:
+            scanned.update(future.result())
+    return scanned
+
+
+def clear_page_cache() -> None:
+    """Drop all cached per-page scan results."""
+    with _page_cache_lock:
+        _page_cache.clear()
+
+
+def _iter_hits(
+    pdf_path: str,
+    *,
+    start_page: int,
+    end_page: Optional[int],
+    x_tolerance: float,
+    y_tolerance: float,
+    workers: int,
+    backend: str,
+    max_scaled: Optional[float] = None,
+    min_scaled: Optional[float] = None,
+    max_raw: Optional[float] = None,
+    min_raw: Optional[float] = None,
+) -> Iterator[NumberHit]:
+    """Yield hits within the thresholds in page order, scanning each page only
+    when it's reached.
+    
+    Cached pages are reused. With ``workers > 1`` the uncached pages are
+    scanned up front in a process pool instead. Thresholds are applied here
+    rather than in ``_scan_words`` so cached pages serve any thresholds.
+    """
+    pdf_key = os.path.abspath(pdf_path)
+    mtime = os.path.getmtime(pdf_key)
+    bounded = any(b is not None for b in (max_scaled, min_scaled, max_raw, min_raw))
+    lo_scaled = -math.inf if min_scaled is None else min_scaled
+    hi_scaled = math.inf if max_scaled is None else max_scaled
+    lo_raw = -math.inf if min_raw is None else min_raw
+    hi_raw = math.inf if max_raw is None else max_raw
+
+    with _open_pdf(pdf_path, backend) as pdf:
+        total_pages = _page_count(pdf, backend)
+        start_idx = max(1, start_page)
+        end_idx = total_pages if end_page is None else min(end_page, total_pages)
+        page_keys = [
+            (pdf_key, mtime, backend, page_num, x_tolerance, y_tolerance)
+            for page_num in range(start_idx, end_idx + 1)
+        ]
+
+        prefetched: Dict[int, Tuple[NumberHit, ...]] = {}
+        if workers > 1:
+            missing = [key[3] for key in page_keys if _cache_get(key) is None]
+            if len(missing) > 1:
+                prefetched = _scan_pages_parallel(
+                    pdf_key, backend, missing, workers, x_tolerance, y_tolerance
+                )
+
+        for key in page_keys:
+            page_num = key[3]
+            page_hits = prefetched.pop(page_num, None)
+            if page_hits is None:
+                page_hits = _cache_get(key)
+            if page_hits is None:
+                page_hits = _scan_page(pdf, backend, page_num, x_tolerance, y_tolerance)
+            _cache_put(key, page_hits)
+            if not bounded:
+                yield from page_hits
+                continue
+            for hit in page_hits:
+                if lo_scaled <= hit.scaled_value <= hi_scaled and lo_raw <= hit.raw_value <= hi_raw:
+                    yield hit
 
 
 def extract_numbers_from_pdf(
@@ -143,10 +557,16 @@ def extract_numbers_from_pdf(
     min_scaled: Optional[float] = None,
     max_raw: Optional[float] = None,
     min_raw: Optional[float] = None,
+    workers: int = 1,
+    top_n: Optional[int] = None,
+    backend: str = "pdfplumber",
 ) -> List[NumberHit]:
     """
     Extract all numbers from a PDF with intelligent scaling.
     
+    Per-page results are cached keyed on the file's absolute path and
+    modification time, so repeated calls on an unchanged PDF skip re-parsing.
+    
     Args:
         pdf_path: Path to PDF file
         start_page: First page to scan (1-based)
@@ -157,110 +577,36 @@ def extract_numbers_from_pdf(
         min_scaled: Minimum scaled value to include
         max_raw: Maximum raw value to include
         min_raw: Minimum raw value to include
+        workers: Number of processes used to scan uncached pages (1 = serial)
+        top_n: Return only the N largest hits, None for all of them
+        backend: "pdfplumber" (default) or "pymupdf", which is faster at
+            word extraction but needs the optional PyMuPDF dependency
         
     Returns:
         List of NumberHit objects sorted by scaled value (descending)
     """
-    hits = []
-    
-    with pdfplumber.open(pdf_path) as pdf:
-        total_pages = len(pdf.pages)
-        start_idx = max(1, start_page)
-        end_idx = total_pages if end_page is None else min(end_page, total_pages)
-
-        for page_num in range(start_idx, end_idx + 1):
-            page = pdf.pages[page_num - 1]
-            words = page.extract_words(x_tolerance=x_tolerance, y_tolerance=y_tolerance) or []
-            line_map = group_words_by_line(words)
-
-            # Extract tables and their scale information
-            try:
-                tables = page.find_tables() or []
-            except Exception:
-                tables = []
-            
-            table_regions = [t.bbox for t in tables if getattr(t, "bbox", None)]
-            table_scales = []
-            for table_bbox in table_regions:
-                scale_name, scale_phrase, scale_bbox = detect_scale_phrase_in_region(words, table_bbox)
-                table_scales.append((table_bbox, scale_name, scale_phrase, scale_bbox))
-
-            # Page-level fallback scale
-            page_scale_name, page_scale_phrase, page_scale_bbox = detect_scale_phrase(words)
-            page_factor = scale_factor(page_scale_name)
-
-            # Process each word
-            for word in words:
-                token = str(word.get("text", ""))
-                raw_val = parse_number(token)
-                if raw_val is None:
-                    continue
-                
-                bbox = (
-                    float(word.get("x0", 0)), float(word.get("top", 0)),
-                    float(word.get("x1", 0)), float(word.get("bottom", 0))
-                )
-                
-                # Find the line this word belongs to
-                y_key = round(float(word.get("top", 0.0)) / 10.0) * 10
-                line_words = line_map.get(y_key, [word])
-
-                # Determine which scale to apply (table-specific or page-level)
-                scale_name = page_scale_name
-                scale_phrase = page_scale_phrase
-                scale_bbox = page_scale_bbox
-                factor = page_factor
-                table_bbox = None
-                
-                for tb_bbox, tb_scale_name, tb_scale_phrase, tb_scale_bbox in table_scales:
-                    if inside_bbox(bbox, tb_bbox):
-                        scale_name = tb_scale_name
-                        scale_phrase = tb_scale_phrase  
-                        scale_bbox = tb_scale_bbox
-                        factor = scale_factor(tb_scale_name)
-                        table_bbox = tb_bbox
-                        break
-
-                # Classify the units and apply appropriate scaling
-                units = classify_units_for_word(word, line_words)
-                apply_factor = factor if units != "people" else 1.0
-                scaled_val = raw_val * apply_factor
-
-                hit = NumberHit(
-                    page_num=page_num,
-                    raw_text=token,
-                    raw_value=raw_val,
-                    scaled_value=scaled_val,
-                    bbox=bbox,
-                    units=units,
-                    scale_name=scale_name,
-                    scale_phrase=scale_phrase,
-                    scale_bbox=scale_bbox,
-                    table_bbox=table_bbox,
-                )
-                hits.append(hit)
-
-    # Apply threshold filters
-    def within_threshold(hit: NumberHit) -> bool:
-        if max_scaled is not None and hit.scaled_value > max_scaled:
-            return False
-        if min_scaled is not None and hit.scaled_value < min_scaled:
-            return False
-        if max_raw is not None and hit.raw_value > max_raw:
-            return False
-        if min_raw is not None and hit.raw_value < min_raw:
-            return False
-        return True
-
-    filtered_hits = [h for h in hits if within_threshold(h)]
-    
-    # Sort by scaled value descending
-    filtered_hits.sort(key=lambda h: h.scaled_value, reverse=True)
+    # Stream filtered hits straight into the ranking rather than collecting them first
+    filtered_hits = _iter_hits(
+        pdf_path,
+        start_page=start_page,
+        end_page=end_page,
+        x_tolerance=x_tolerance,
+        y_tolerance=y_tolerance,
+        workers=workers,
+        backend=backend,
+        max_scaled=max_scaled,
+        min_scaled=min_scaled,
+        max_raw=max_raw,
+        min_raw=min_raw,
+    )
     
-    return filtered_hits
+    # Sort by scaled value descending; a bounded heap is enough for top N
+    if top_n is not None and top_n > 0:
+        return heapq.nlargest(top_n, filtered_hits, key=lambda h: h.scaled_value)
+    return sorted(filtered_hits, key=lambda h: h.scaled_value, reverse=True)
 
 
 def find_largest_number(pdf_path: str, **kwargs) -> Optional[NumberHit]:
     """Find the single largest number in a PDF with scaling applied."""
-    hits = extract_numbers_from_pdf(pdf_path, **kwargs)
+    hits = extract_numbers_from_pdf(pdf_path, **{**kwargs, "top_n": 1})
     return hits[0] if hits else None
\ No newline at end of file
@@ -10,27 +10,63 @@ from typing import Optional, Tuple
 #   (Millions), ($ Millions)
 #   reported in millions of dollars
 #   ($ in M) / (K|M|B)
+# Patterns are listed in priority order: when several match the same text the
+# earliest one wins, so an explicit phrase beats a loose "(K)"/"(M)"/"(B)".
+# SCALE_RE fuses them into one alternation (alternative "p<i>", scale word
+# "s<i>") so a single search can tell whether a line has any cue at all;
+# search_scale_phrase then applies the priority order on that text.
 
-_PATTERNS = [
+_PATTERN_SOURCES = [
     # Classic forms
-    re.compile(r"\(\s*\$?\s*in\s*(thousands|millions|billions)\s*\)", re.I),
-    re.compile(r"\b(amounts?|figures?|values?)\s+in\s+(thousands|millions|billions)\b", re.I),
-    re.compile(r"\b(?:in|reported in)\s+(thousands|millions|billions)\s+of\s+(?:dollars|usd)\b", re.I),
+    r"\(\s*\$?\s*in\s*(?P<s0>thousands|millions|billions)\s*\)",
+    r"\b(?:amounts?|figures?|values?)\s+in\s+(?P<s1>thousands|millions|billions)\b",
+    r"\b(?:in|reported in)\s+(?P<s2>thousands|millions|billions)\s+of\s+(?:dollars|usd)\b",
 
     # BI Publisher special: "(Dollars in Millions)" / "Dollars in Millions"
-    re.compile(r"\(\s*(?:dollars|usd)\s+in\s+(thousands|millions|billions)\s*\)", re.I),
-    re.compile(r"\b(?:dollars|usd)\s+in\s+(thousands|millions|billions)\b", re.I),
+    r"\(\s*(?:dollars|usd)\s+in\s+(?P<s3>thousands|millions|billions)\s*\)",
+    r"\b(?:dollars|usd)\s+in\s+(?P<s4>thousands|millions|billions)\b",
 
     # Short-hand header-like variants
-    re.compile(r"\(\s*\$?\s*(thousands|millions|billions)\s*\)", re.I),
+    r"\(\s*\$?\s*(?P<s5>thousands|millions|billions)\s*\)",
 
     # Abbreviations
-    re.compile(r"\(\s*\$?\s*(?:in\s+)?(K|M|B)\s*\)", re.I),
+    r"\(\s*\$?\s*(?:in\s+)?(?P<s6>K|M|B)\s*\)",
 ]
 
+SCALE_RE = re.compile(
+    "|".join(f"(?P<p{i}>{src})" for i, src in enumerate(_PATTERN_SOURCES)),
+    re.I,
+)
+
+_PATTERNS = [re.compile(src, re.I) for src in _PATTERN_SOURCES]
+
 _ABBR = {"K": "thousands", "M": "millions", "B": "billions"}
 
 
+def search_scale_phrase(text: str) -> Optional[re.Match]:
+    """Find the highest-priority scale phrase in text, or None.
+
+    Uses the fused SCALE_RE as a quick reject, then tries the patterns in
+    priority order and returns the leftmost match of the first that hits.
+    """
+    if not SCALE_RE.search(text):
+        return None
+    for pat in _PATTERNS:
+        m = pat.search(text)
+        if m:
+            return m
+    return None
+
+
+def scale_from_match(m: re.Match) -> Optional[str]:
+    """Map a scale pattern match to "thousands", "millions" or "billions"."""
+    # lastgroup is "p<i>" for SCALE_RE and "s<i>" for a single pattern
+    grp = m.group("s" + m.lastgroup[1:])
+    if grp and grp.upper() in _ABBR:  # K/M/B path
+        return _ABBR[grp.upper()]
+    return grp.lower() if grp else None
+
+
 def page_scale_hint(text: str) -> Tuple[Optional[str], Optional[str]]:
     """Detect a page-level scale cue.
 
@@ -40,14 +76,7 @@ def page_scale_hint(text: str) -> Tuple[Optional[str], Optional[str]]:
     """
     if not text:
         return None, None
-    for pat in _PATTERNS:
-        m = pat.search(text)
-        if not m:
-            continue
-        grp = m.group(1)
-        if grp and grp.upper() in _ABBR:  # K/M/B path
-            scale = _ABBR[grp.upper()]
-        else:
-            scale = grp.lower() if grp else None
-        return scale, m.group(0)
-    return None, None
\ No newline at end of file
+    m = search_scale_phrase(text)
+    if not m:
+        return None, None
+    return scale_from_match(m), m.group(0)
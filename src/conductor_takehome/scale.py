@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Optional, Dict, Any
+from bisect import bisect_right
+from itertools import groupby
+from operator import itemgetter
+from typing import List, Tuple, Optional, Any
 
 # Reuse the package's scale phrase recognizers
-from .filters import _PATTERNS as SCALE_PATTERNS  # type: ignore[attr-defined]
-from .filters import _ABBR as SCALE_ABBR  # type: ignore[attr-defined]
+from .filters import SCALE_RE, scale_from_match, search_scale_phrase
 
+# Joins line texts for a page-wide search. Neither \s nor \w matches it, so
+# a phrase can never match across two lines.
+_LINE_SEP = "\x00"
 
-def _lines_by_y(words: List[dict], bucket: float = 10.0) -> Dict[float, List[dict]]:
-    lines: Dict[float, List[dict]] = {}
-    for w in words:
-        y = round(float(w.get("top", 0.0)) / bucket) * bucket
-        lines.setdefault(y, []).append(w)
-    return lines
+
+def _y_bucket(w: dict, bucket: float = 10.0) -> float:
+    return round(float(w.get("top", 0.0)) / bucket) * bucket
 
 
 def _line_text_and_spans(line_words: List[dict]) -> Tuple[str, List[Tuple[int, int]]]:
@@ -57,28 +59,54 @@ def detect_scale_phrase(words: List[dict]) -> Tuple[Optional[str], Optional[str]
     if not words:
         return None, None, None
 
-    lines = _lines_by_y(words)
-    for _, line_words in sorted(lines.items(), key=lambda kv: kv[0]):
+    # Walk lines top-down and stop at the first match: the phrase is usually
+    # in a header, so most lines never get joined or searched. Sorting on the
+    # bucket (stable) keeps each line's words in their original order.
+    keyed = sorted(((_y_bucket(w), w) for w in words), key=itemgetter(0))
+    for _, group in groupby(keyed, key=itemgetter(0)):
+        line_words = [w for _, w in group]
         text, spans = _line_text_and_spans(line_words)
         if not text:
             continue
-        for pat in SCALE_PATTERNS:
-            m = pat.search(text)
-            if not m:
-                continue
-            grp = m.group(1)
-            if grp and grp.upper() in SCALE_ABBR:
-                scale = SCALE_ABBR[grp.upper()]
-            else:
-                scale = grp.lower() if grp else None
+        m = search_scale_phrase(text)
+        if m:
             bbox = _bbox_for_char_span(line_words, spans, m.start(), m.end())
-            return scale, m.group(0), bbox
+            return scale_from_match(m), m.group(0), bbox
 
     return None, None, None
 
 
+def detect_scale_phrase_in_lines(
+    lines: List[List[dict]],
+) -> Tuple[Optional[str], Optional[str], Optional[Tuple[float, float, float, float]]]:
+    """Same as detect_scale_phrase, for words already grouped into lines in Y order."""
+    # Scan the whole page once; scale phrases are rare, so only the line that
+    # matched is mapped back to word spans for its bbox.
+    texts = [" ".join(str(w.get("text", "")) for w in lw) for lw in lines]
+    starts: List[int] = []
+    pos = 0
+    for text in texts:
+        starts.append(pos)
+        pos += len(text) + len(_LINE_SEP)
+
+    hit = SCALE_RE.search(_LINE_SEP.join(texts))
+    if not hit:
+        return None, None, None
+
+    # The page-wide match only locates the first line with a cue; pattern
+    # priority is then resolved on that line alone
+    i = bisect_right(starts, hit.start()) - 1
+    m = search_scale_phrase(texts[i])
+    _, spans = _line_text_and_spans(lines[i])
+    bbox = _bbox_for_char_span(lines[i], spans, m.start(), m.end())
+    return scale_from_match(m), m.group(0), bbox
+
+
+_SCALE_FACTORS = {"thousands": 1_000.0, "millions": 1_000_000.0, "billions": 1_000_000_000.0}
+
+
 def scale_factor(scale: Optional[str]) -> float:
-    return {"thousands": 1_000.0, "millions": 1_000_000.0, "billions": 1_000_000_000.0}.get((scale or "").lower(), 1.0)
+    return _SCALE_FACTORS.get(scale.lower(), 1.0) if scale else 1.0
 
 
 def _inside(box: Tuple[float, float, float, float], region: Tuple[float, float, float, float], tol: float = 0.5) -> bool: